@@ -1,20 +1,42 @@
+import asyncio
 import discord
 import logging
 from discord import app_commands
 from discord.ext import commands, tasks
 import yaml
 from bot.utils.settings_manager import settings_manager
+from bot.utils.schedule_projection import ScheduleProjector
+from bot.utils.startup_timings import startup_timings
+from bot.utils.clock import SystemClock
+from bot.utils.alert_state import AlertStateStore
+from bot.utils import state_snapshot
 from datetime import datetime, timedelta
 import pytz
 import os
 import json
+import glob
 import re
+import time
+from typing import NamedTuple
+
+class AlertWindow(NamedTuple):
+    lead_minutes: int = 15          # First post this long before the raid starts
+    starting_minutes: int = 5       # "starting" status from this many minutes out
+    ongoing_minutes: int = 5        # "finished" this long after the raid starts
+    edit_interval_minutes: int = 1  # Minimum time between edits of the same status
+
+DEFAULT_ALERT_WINDOW = AlertWindow()
 
 class RaidAlert(commands.Cog):
-    def __init__(self, bot):
+    ALERT_STATE_FILE = 'alert_state.json'
+
+    def __init__(self, bot, clock=None, settings=None, snapshot=True, alert_state=None):
         self.bot = bot
-        self.settings_manager = settings_manager
-        self.guild_alert_config = self.settings_manager.settings
+        # Injectable for replays and tests; defaults to wall clock and shared settings
+        self.clock = clock or SystemClock()
+        self.settings_manager = settings or settings_manager
+        # Replays and tests pass snapshot=False so they never read or overwrite the warm snapshot
+        self.use_snapshot = snapshot
         self.sent_messages = {}
         self.completed_raids = set()
         # Timezones
@@ -30,15 +52,38 @@ class RaidAlert(commands.Cog):
         # Raid cleanup
         self.last_cleanup_time = None
         self.COMPLETED_RAIDS_CLEANUP_INTERVAL = 7 * 24 * 60 * 60
-        # Raids loaded from config
-        self.raids = self._load_raid_schedule()
+        # Raids, locales and assets; filled by _load_state() in cog_load
+        self.NEXT_RAIDS_HORIZON_DAYS = 7
+        self.NEXT_RAIDS_PAGE_SIZE = 10
+        self.raids = []
+        self.locales = {}
+        self.raid_assets = {}
+        self.schedule_projector = ScheduleProjector(self.raids, self.default_tz, self.NEXT_RAIDS_HORIZON_DAYS)
+        self.first_tick_done = False
         # List of (guild_id, raid_dict) for test/dummy alerts
         self.test_raids = []
-        # Start background loop
+        # Runtime alert state lives in its own file, never in guild settings; restored in cog_load
+        self.alert_state = alert_state or AlertStateStore(self.ALERT_STATE_FILE)
+        self.BULK_DELETE_LIMIT = 100
+        self.BULK_DELETE_MAX_AGE = timedelta(days=14)
+
+    async def cog_load(self):
+        # Parse sources or read the snapshot in a worker thread so other extensions keep loading
+        with startup_timings.phase("schedule_compile"):
+            await asyncio.to_thread(self._load_state)
+        await asyncio.to_thread(self._load_alert_state)
+        # Start background loops once the cog is attached to the bot
         self._raid_alert_loop.start()
+        self._message_retention_loop.start()
 
     def cog_unload(self):
         self._raid_alert_loop.cancel()
+        self._message_retention_loop.cancel()
+
+    @property
+    def guild_alert_config(self):
+        # Always read through the manager; load_settings() replaces the dict
+        return self.settings_manager.settings
 
     ###########################################################
     # Utilities
@@ -49,34 +94,81 @@ class RaidAlert(commands.Cog):
         log_method = getattr(logger, level.lower(), logger.info)
         log_method(msg)
 
-    def _load_raid_schedule(self, config_path="raid_schedule.yaml"):
-        config_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "raid_schedule.yaml")
-        with open(config_path, "r", encoding="utf-8") as f:
+    def _load_raid_schedule(self, config_path=None):
+        with open(config_path or state_snapshot.SCHEDULE_PATH, "r", encoding="utf-8") as f:
             config = yaml.safe_load(f)
         return config["raids"]
 
+    def _load_locales(self, locales_dir=None):
+        locales = {}
+        locales_dir = locales_dir or state_snapshot.LOCALES_DIR
+        for locale_path in sorted(glob.glob(os.path.join(locales_dir, "*.json"))):
+            with open(locale_path, "r", encoding="utf-8") as f:
+                locales[os.path.splitext(os.path.basename(locale_path))[0]] = json.load(f)
+        return locales
+
+    def _load_state(self):
+        # Compile schedule, locales and asset lookups, or reuse the snapshot if sources are unchanged
+        signature = state_snapshot.source_signature() if self.use_snapshot else None
+        snapshot = state_snapshot.load_snapshot(signature) if self.use_snapshot else None
+        if snapshot:
+            self.raids = snapshot["raids"]
+            self.locales = snapshot["locales"]
+            self.raid_assets = snapshot["assets"]
+        else:
+            self.raids = self._load_raid_schedule()
+            self.locales = self._load_locales()
+            self.raid_assets = {self._clean_boss_name(r["name"]): r for r in self.raids}
+        self.schedule_projector = ScheduleProjector(self.raids, self.default_tz, self.NEXT_RAIDS_HORIZON_DAYS)
+        if snapshot:
+            self.schedule_projector.restore_cache(*snapshot["timeline"])
+        previous_key = self.schedule_projector.export_cache()[0]
+        self.schedule_projector.project(self._get_current_kst())
+        self._log("INFO", f"📦 Raid state {'restored from snapshot' if snapshot else 'compiled from sources'}")
+        if self.use_snapshot and (not snapshot or self.schedule_projector.export_cache()[0] != previous_key):
+            state_snapshot.save_snapshot(signature, {
+                "raids": self.raids,
+                "locales": self.locales,
+                "assets": self.raid_assets,
+                "timeline": self.schedule_projector.export_cache()
+            })
+
+    def _set_raids(self, raids):
+        # Swap in another schedule, e.g. a synthetic one for replays
+        self.raids = raids
+        self.raid_assets = {self._clean_boss_name(r["name"]): r for r in raids}
+        self.schedule_projector.set_schedule(raids)
+
     def _get_current_kst(self):
-        return datetime.now(self.default_tz)
+        return self.clock.now(self.default_tz)
 
     def _clean_boss_name(self, raw_name: str) -> str:
         return re.sub(r'^\W+\s+', '', raw_name).strip()
 
     def _get_raid_config(self, raid_name: str) -> dict:
-        clean_name = self._clean_boss_name(raid_name)
-        return next((r for r in self.raids if self._clean_boss_name(r["name"]) == clean_name), {})
+        return self.raid_assets.get(self._clean_boss_name(raid_name), {})
 
     def _get_image_url(self, raid_name: str) -> str:
         raid_config = self._get_raid_config(raid_name)
         if image_file := raid_config.get("image"):
-            return f"{os.getenv('DSR_RAID_ALERT_ICONS')}/{image_file}?v={int(datetime.now().timestamp())}"
+            return f"{os.getenv('DSR_RAID_ALERT_ICONS')}/{image_file}?v={int(self._get_current_kst().timestamp())}"
         raise ValueError(f"❌ Missing image config for {raid_name}")
 
     def _get_map_url(self, raid_name: str) -> str: 
         raid_config = self._get_raid_config(raid_name)
         if map_file := raid_config.get("map_image"):
-            return f"{os.getenv('DSR_RAID_ALERT_MAPS')}/{map_file}?v={int(datetime.now().timestamp())}"
+            return f"{os.getenv('DSR_RAID_ALERT_MAPS')}/{map_file}?v={int(self._get_current_kst().timestamp())}"
         raise ValueError(f"❌ Missing map image config for {raid_name}")
 
+    def _format_gmt_offset(self, dt) -> str:
+        total_offset = dt.utcoffset().total_seconds()
+        offset_hours = int(total_offset // 3600)
+        offset_minutes = int((total_offset % 3600) // 60)
+        tz_offset = f"GMT{'+' if offset_hours >=0 else '-'}{abs(offset_hours)}"
+        if offset_minutes != 0:
+            tz_offset += f":{abs(offset_minutes):02d}"
+        return tz_offset
+
     def _get_remaining_minutes(self, seconds_total: int) -> int:
         # Round up if more than 30 seconds
         if seconds_total <= 0:
@@ -91,21 +183,22 @@ class RaidAlert(commands.Cog):
     # Status and Color Helpers
     ###########################################################
 
-    def _compute_status(self, time_diff):
+    def _compute_status(self, time_diff, window=DEFAULT_ALERT_WINDOW):
         # Determine raid status based on time difference (seconds)
         minutes_until = self._get_remaining_minutes(int(time_diff))
-        if time_diff < -300:
+        finished_after = window.ongoing_minutes * 60
+        if time_diff < -finished_after:
             return "finished"
-        elif minutes_until > 5:
+        elif minutes_until > window.starting_minutes:
             return "upcoming"
-        elif 1 <= minutes_until <= 5:
+        elif 1 <= minutes_until <= window.starting_minutes:
             return "starting"
-        elif minutes_until == 0 or (time_diff < 0 and time_diff >= -300):
+        elif minutes_until == 0 or (time_diff < 0 and time_diff >= -finished_after):
             return "ongoing"
 
-    def _get_raid_status(self, time_diff):
+    def _get_raid_status(self, time_diff, window=DEFAULT_ALERT_WINDOW):
         # Return (status, color) tuple
-        status = self._compute_status(time_diff)
+        status = self._compute_status(time_diff, window)
         color = {
             "upcoming": 0xFF0000,
             "starting": 0xFFFF00,
@@ -126,7 +219,7 @@ class RaidAlert(commands.Cog):
         display_time = raid["next_time"].astimezone(tz)
         minutes_until = self._get_remaining_minutes(int(time_until_raid_seconds))
         clean_name = self._clean_boss_name(raid['name'])
-        status, color = self._get_raid_status(time_until_raid_seconds)
+        status, color = self._get_raid_status(time_until_raid_seconds, self._get_alert_window(guild_id))
         
         # Get localized strings from guild's locale
         raid_alerts = locale.get('raid_alerts', {})
@@ -140,13 +233,7 @@ class RaidAlert(commands.Cog):
         else:
             desc_status = raid_alerts['finished']
             
-        total_offset = display_time.utcoffset().total_seconds()
-        offset_hours = int(total_offset // 3600)
-        offset_minutes = int((total_offset % 3600) // 60)
-        tz_offset = f"GMT{'+' if offset_hours >=0 else '-'}{abs(offset_hours)}"
-        if offset_minutes != 0:
-            tz_offset += f":{abs(offset_minutes):02d}"
-        time_str = f"{display_time.strftime('%H:%M')} ({tz_offset})"
+        time_str = f"{display_time.strftime('%H:%M')} ({self._format_gmt_offset(display_time)})"
         embed = discord.Embed(
             title=clean_name,
             color=color
@@ -184,87 +271,31 @@ class RaidAlert(commands.Cog):
         return content
 
     ###########################################################
-    # Raid Time Calculations
-    ###########################################################
-
-    def _get_next_daily_time(self, time_str):
-        now = self._get_current_kst()
-        raid_time = datetime.strptime(time_str, "%H:%M").time()
-        raid_dt = self.default_tz.localize(datetime.combine(now.date(), raid_time))
-        if raid_dt <= now:
-            raid_dt += timedelta(days=1)
-        return raid_dt
-
-    def _get_next_biweekly_time(self, time_str, base_date_str):
-        now = self._get_current_kst()
-        base_date = self.default_tz.localize(datetime.strptime(base_date_str, "%Y-%m-%d"))
-        raid_time = datetime.strptime(time_str, "%H:%M").time()
-        diff_days = (now.date() - base_date.date()).days
-        cycles = diff_days // 14
-        next_date = base_date + timedelta(days=cycles * 14)
-        raid_dt = self.default_tz.localize(datetime.combine(next_date.date(), raid_time))
-        if raid_dt <= now:
-            raid_dt += timedelta(days=14)
-        return raid_dt
-
-    def _get_next_rotation_time(self, base_time_str, base_date_str):
-        now = self._get_current_kst()
-        base_date = self.default_tz.localize(datetime.strptime(base_date_str, "%Y-%m-%d"))
-        base_hour, base_minute = map(int, base_time_str.split(":"))
-        now_midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
-        base_midnight = base_date.replace(hour=0, minute=0, second=0, microsecond=0)
-        diff_days = (now_midnight - base_midnight).days
-        raid_time = base_date + timedelta(days=diff_days)
-        raid_time = raid_time.replace(hour=base_hour, minute=base_minute)
-        raid_time += timedelta(minutes=diff_days * 25)
-        if raid_time <= now:
-            diff_days += 1
-            raid_time = base_date + timedelta(days=diff_days)
-            raid_time = raid_time.replace(hour=base_hour, minute=base_minute)
-            raid_time += timedelta(minutes=diff_days * 25)
-        return raid_time
-
-    ###########################################################
-    # Raid List (real + test/dummy)
+    # Alert Windows
     ###########################################################
 
-    def _get_upcoming_raids(self):
-        # Build list of all upcoming raids (real + test)
-        raids = []
-        for cfg in self.raids:
-            name = cfg["name"]
-            map_name = cfg["map"]
-            freq = cfg.get("frequency", "daily")
-            times = cfg.get("times", [])
-            base_date = cfg.get("base_date")
-            if freq == "rotation":
-                base_time = times[0]
-                next_time_dt = self._get_next_rotation_time(base_time, base_date)
-                raids.append({
-                    "name": name,
-                    "map": map_name,
-                    "next_time": next_time_dt,
-                    "scheduled_time": base_time,
-                    "image": self._get_image_url(self._clean_boss_name(name)),
-                })
-                continue
-            for t in times:
-                if freq == "biweekly":
-                    next_time_dt = self._get_next_biweekly_time(t, base_date)
-                else:
-                    next_time_dt = self._get_next_daily_time(t)
-                raids.append({
-                    "name": name,
-                    "map": map_name,
-                    "next_time": next_time_dt,
-                    "scheduled_time": t,
-                    "image": self._get_image_url(self._clean_boss_name(name)),
-                })
-        # Add test/dummy raids (from /testalert) to the list
-        for guild_id, test_raid in getattr(self, 'test_raids', []):
-            raids.append(test_raid)
-        raids.sort(key=lambda r: r["next_time"])
-        return raids
+    def _get_alert_window(self, guild_id) -> AlertWindow:
+        raid_config = self.guild_alert_config.get(str(guild_id), {}).get('raid_alerts', {})
+        return AlertWindow(**{
+            field: int(raid_config.get(field, default))
+            for field, default in DEFAULT_ALERT_WINDOW._asdict().items()
+        })
+
+    def _get_alert_key(self, raid):
+        # One message per guild and occurrence; the timestamp is parsed back by the cleanup
+        return (raid['guild_id'], raid["name"], raid["next_time"].strftime("%Y-%m-%d %H:%M:%S"))
+
+    def _get_active_raids(self, guild_ids, lead, ongoing, now_kst):
+        # Slice the shared timeline once per (lead, ongoing) span, then fan out to every guild using it
+        active = self.schedule_projector.window(now_kst, lead, ongoing)
+        for guild_id in guild_ids:
+            test_raids = [
+                r for gid, r in self.test_raids
+                if str(gid) == str(guild_id) and now_kst - ongoing <= r["next_time"] <= now_kst + lead
+            ]
+            for occurrence in active:
+                yield {**occurrence, "guild_id": str(guild_id)}
+            yield from test_raids
 
     ###########################################################
     # Send or Update Raid Alert Message
@@ -286,17 +317,23 @@ class RaidAlert(commands.Cog):
             self._log("DEBUG", f"❌ Channel {channel_id} not found in guild {guild_id}.")
             return
         
+        now_kst = self._get_current_kst()
+        time_until_raid_seconds = (raid["next_time"] - now_kst).total_seconds()
+        key = self._get_alert_key(raid)
+        window = self._get_alert_window(guild_id)
+        status, _ = self._get_raid_status(time_until_raid_seconds, window)
+
+        # Throttle edits to the guild's interval unless the status changed
+        entry = self.sent_messages.get(key)
+        if entry and entry.get('status') == status and entry['last_update']:
+            since_update = (now_kst - entry['last_update']).total_seconds()
+            if since_update < window.edit_interval_minutes * 60:
+                return
+
         role_mention = f"<@&{role_id}>"
-        time_until_raid_seconds = (raid["next_time"] - self._get_current_kst()).total_seconds()
         embed, status = self._create_embed_content(raid, time_until_raid_seconds)
         content = self._create_message_content(raid, time_until_raid_seconds, role_mention, status)
 
-        # For real raids (no guild_id), use global key. For tests, include guild_id
-        if 'guild_id' in raid:  # Test raid
-            key = (raid['guild_id'], raid["name"], raid["scheduled_time"])
-        else:  # Real raid
-            key = (raid["name"], raid["scheduled_time"])
-
         self._log("DEBUG", f"send_or_update_raid_alert: key={key}, status={status}, time_until={time_until_raid_seconds}")
         # If already sent, update only if status or color changed
         if key in self.sent_messages:
@@ -305,6 +342,12 @@ class RaidAlert(commands.Cog):
                 self._log("DEBUG", f"🔄 Attempting to update message {msg_id} in channel {channel_id}")
                 msg = await channel.fetch_message(msg_id)
                 prev_embed = self.sent_messages[key]['embed']
+                if prev_embed is None:
+                    # Restored after a restart: the posted embed is unknown, so replace it whole
+                    await msg.edit(content=content, embed=embed, allowed_mentions=discord.AllowedMentions(roles=True))
+                    self.sent_messages[key].update(embed=embed, status=status, last_update=self._get_current_kst())
+                    self._log("DEBUG", f"🆕 Refreshed restored message {msg_id} for {key}")
+                    return
                 # Only update the last field and color if changed
                 prev_status_field = prev_embed.fields[-1].value if prev_embed.fields else None
                 new_status_field = embed.fields[-1].value if embed.fields else None
@@ -317,6 +360,7 @@ class RaidAlert(commands.Cog):
                     prev_embed.color = embed.color
                     await msg.edit(content=content, embed=prev_embed, allowed_mentions=discord.AllowedMentions(roles=True))
                     self.sent_messages[key]['embed'] = prev_embed  # Store the modified embed
+                    self.sent_messages[key]['status'] = status
                     self.sent_messages[key]['last_update'] = self._get_current_kst()
                     self._log("DEBUG", f"🆕 Updated message {msg_id} for {key}")
                 else:
@@ -331,6 +375,7 @@ class RaidAlert(commands.Cog):
                 'channel_id': channel_id,
                 'embed': embed,
                 'raid': raid,
+                'status': status,
                 'last_update': self._get_current_kst()
             }
             self._log("DEBUG", f"🆕 Sent new message {sent.id} for {key}")
@@ -340,8 +385,8 @@ class RaidAlert(commands.Cog):
     ###########################################################
     @tasks.loop(seconds=10)
     async def _raid_alert_loop(self):
+        tick_start = time.perf_counter()
         now_kst = self._get_current_kst()
-        upcoming_raids = self._get_upcoming_raids()
         # Periodic cleanup of completed_raids (every 7 days)
         if self.last_cleanup_time is None or (now_kst - self.last_cleanup_time).total_seconds() > self.COMPLETED_RAIDS_CLEANUP_INTERVAL:
             cutoff = now_kst - timedelta(seconds=self.COMPLETED_RAIDS_CLEANUP_INTERVAL)
@@ -359,41 +404,172 @@ class RaidAlert(commands.Cog):
             self._log("CLEANUP", f"Cleaned up completed_raids: {before} -> {after}")
             self.last_cleanup_time = now_kst
 
-        # For each enabled guild, send/update alerts
-        for guild_id, config in self.guild_alert_config.items():
-            # Ensure we have a valid config structure
-            raid_config = config.get('raid_alerts', {})
-            if not raid_config.get('enabled', False):
-                continue
-            
-            # Filter raids to only those for this guild (convert to string for type match)
-            guild_raids = [r for r in upcoming_raids if r.get('guild_id') == str(guild_id)]
-            for raid in guild_raids:
-                time_diff = (raid["next_time"] - now_kst).total_seconds()
-                # Match key format from send_or_update_raid_alert
-                if 'guild_id' in raid:  # Test raid
-                    key = (raid['guild_id'], raid["name"], raid["scheduled_time"])
-                else:  # Real raid
-                    key = (raid["name"], raid["scheduled_time"])
-                # Update for all non-finished raids #TODO CHECK
-                status = self._get_raid_status(time_diff)
-                if status != "finished" and key not in self.completed_raids:
+        # Raids past their window: update message to finished state before removing
+        for key, entry in list(self.sent_messages.items()):
+            raid = entry['raid']
+            window = self._get_alert_window(raid['guild_id'])
+            status, _ = self._get_raid_status((raid["next_time"] - now_kst).total_seconds(), window)
+            if status == "finished":
+                self._log("INFO", f"🏁 Marking {key} as finished, updating message to finished state before removal")
+                await self._send_or_update_raid_alert(raid['guild_id'], raid)
+                del self.sent_messages[key]
+                self.completed_raids.add(key)
+                # Alerts restored after downtime may have finished while the bot was offline
+                finished_at = min(now_kst, raid["next_time"] + timedelta(minutes=window.ongoing_minutes))
+                self._track_finished_message(raid['guild_id'], entry, finished_at)
+
+        # Bucket enabled guilds by the span they watch so each span scans the timeline once;
+        # starting and edit intervals only matter per guild in _send_or_update_raid_alert
+        span_buckets = {}
+        for guild_id in self.settings_manager.get_enabled_guilds():
+            window = self._get_alert_window(guild_id)
+            span = (timedelta(minutes=window.lead_minutes), timedelta(minutes=window.ongoing_minutes))
+            span_buckets.setdefault(span, []).append(guild_id)
+
+        for (lead, ongoing), guild_ids in span_buckets.items():
+            for raid in self._get_active_raids(guild_ids, lead, ongoing, now_kst):
+                key = self._get_alert_key(raid)
+                if key not in self.completed_raids:
                     self._log("DEBUG", f"🛠️ Will send/update alert for {key}")
-                    await self._send_or_update_raid_alert(guild_id, raid)
-                
-                # If finished, update message to finished state before removing
-                if key in self.sent_messages and status == "finished":
-                    self._log("INFO", f"🏁 Marking {key} as finished, updating message to finished state before removal")
-                    # Force update to finished state
-                    await self._send_or_update_raid_alert(guild_id, raid)
-                    del self.sent_messages[key]
-                    self.completed_raids.add(key)
+                    await self._send_or_update_raid_alert(raid['guild_id'], raid)
+
+        # One write per tick at most, however many alerts were posted or finished
+        self._sync_in_flight()
+        self.alert_state.flush()
+
+        if not self.first_tick_done:
+            self.first_tick_done = True
+            startup_timings.record("first_tick", time.perf_counter() - tick_start)
+            startup_timings.record("time_to_first_tick", startup_timings.since_start())
+            self._log("INFO", f"⏱️ Startup timings: {startup_timings.summary()}")
+
+    ###########################################################
+    # In-Flight Alert State
+    ###########################################################
+
+    def _load_alert_state(self):
+        # Alerts posted before a restart or reload are edited and finished instead of posted again
+        self.alert_state.load()
+        for stored in self.alert_state.in_flight:
+            raid = {**stored['raid'], 'next_time': stored['raid']['next_time'].astimezone(self.default_tz)}
+            self.sent_messages[self._get_alert_key(raid)] = {
+                'message_id': stored['message_id'],
+                'channel_id': stored['channel_id'],
+                'embed': None,
+                'raid': raid,
+                'status': stored['status'],
+                'last_update': None
+            }
+        if self.alert_state.in_flight:
+            self._log("INFO", f"♻️ Restored {len(self.alert_state.in_flight)} in-flight alerts")
+
+    def _sync_in_flight(self):
+        in_flight = [
+            {'message_id': entry['message_id'], 'channel_id': entry['channel_id'],
+             'status': entry['status'], 'raid': entry['raid']}
+            for entry in self.sent_messages.values()
+        ]
+        # Only sends, status changes and finishes change this, not the per-minute countdown edits
+        if in_flight != self.alert_state.in_flight:
+            self.alert_state.in_flight = in_flight
+            self.alert_state.mark_dirty()
 
     @_raid_alert_loop.before_loop
     async def before_raid_alert_loop(self):
         # Wait for bot to be ready before starting loop
         await self.bot.wait_until_ready()
 
+    ###########################################################
+    # Finished Message Retention
+    ###########################################################
+
+    def _get_retention_policy(self, guild_id):
+        # (keep_last, delete_after_hours); 0 or missing disables that rule
+        raid_config = self.guild_alert_config.get(str(guild_id), {}).get('raid_alerts', {})
+        return int(raid_config.get('retention_keep_last') or 0), int(raid_config.get('retention_hours') or 0)
+
+    @property
+    def finished_messages(self):
+        # Finished alerts awaiting retention cleanup, per guild; survives restarts and reloads
+        return self.alert_state.finished
+
+    def _track_finished_message(self, guild_id, entry, finished_at):
+        if not any(self._get_retention_policy(guild_id)):
+            return
+        self.finished_messages.setdefault(str(guild_id), []).append({
+            'message_id': entry['message_id'],
+            'channel_id': entry['channel_id'],
+            'finished_at': finished_at
+        })
+        self.alert_state.mark_dirty()
+
+    def _select_expired_messages(self, finished, keep_last, delete_after_hours, now):
+        # Finished messages are appended in order, so the oldest come first
+        expired = finished[:-keep_last] if keep_last and len(finished) > keep_last else []
+        if delete_after_hours:
+            cutoff = now - timedelta(hours=delete_after_hours)
+            expired += [m for m in finished[len(expired):] if m['finished_at'] <= cutoff]
+        return expired
+
+    async def _bulk_delete_messages(self, channel_id, message_ids):
+        # Returns the IDs that are gone (deleted or already missing); the rest stay queued for a retry
+        channel = self.bot.get_channel(channel_id)
+        if not channel:
+            self._log("DEBUG", f"❌ Channel {channel_id} not found, dropping {len(message_ids)} finished alerts.")
+            return set(message_ids)
+        deleted = set()
+        # Bulk delete only accepts messages younger than 14 days
+        bulk_cutoff = self._get_current_kst() - self.BULK_DELETE_MAX_AGE
+        recent = [i for i in message_ids if discord.utils.snowflake_time(i) > bulk_cutoff]
+        stale = [i for i in message_ids if discord.utils.snowflake_time(i) <= bulk_cutoff]
+        for start in range(0, len(recent), self.BULK_DELETE_LIMIT):
+            chunk = recent[start:start + self.BULK_DELETE_LIMIT]
+            try:
+                await channel.delete_messages([discord.Object(id=i) for i in chunk])
+                self._log("DEBUG", f"🧹 Bulk deleted {len(chunk)} finished alerts in channel {channel_id}")
+            except discord.NotFound:
+                pass
+            except discord.HTTPException as e:
+                self._log("DEBUG", f"❌ Failed to bulk delete in channel {channel_id}: {e}")
+                continue
+            deleted.update(chunk)
+        for message_id in stale:
+            try:
+                await channel.get_partial_message(message_id).delete()
+            except discord.NotFound:
+                pass
+            except discord.HTTPException as e:
+                self._log("DEBUG", f"❌ Failed to delete message {message_id}: {e}")
+                continue
+            deleted.add(message_id)
+        return deleted
+
+    @tasks.loop(minutes=10)
+    async def _message_retention_loop(self):
+        now_kst = self._get_current_kst()
+        for guild_id, finished in list(self.finished_messages.items()):
+            keep_last, delete_after_hours = self._get_retention_policy(guild_id)
+            expired = self._select_expired_messages(finished, keep_last, delete_after_hours, now_kst)
+            if not expired:
+                continue
+            by_channel = {}
+            for message in expired:
+                by_channel.setdefault(message['channel_id'], []).append(message['message_id'])
+            deleted = set()
+            for channel_id, message_ids in by_channel.items():
+                deleted |= await self._bulk_delete_messages(channel_id, message_ids)
+            if not deleted:
+                continue
+            # Failed deletes keep their place in the queue and are retried next pass
+            self.finished_messages[guild_id] = [m for m in finished if m['message_id'] not in deleted]
+            self.alert_state.mark_dirty()
+            self._log("CLEANUP", f"Deleted {len(deleted)} of {len(expired)} expired finished alerts for guild {guild_id}")
+        self.alert_state.flush()
+
+    @_message_retention_loop.before_loop
+    async def before_message_retention_loop(self):
+        await self.bot.wait_until_ready()
+
     ###########################################################
     # Bot Commands
     ###########################################################
@@ -439,7 +615,6 @@ class RaidAlert(commands.Cog):
             )
             return
 
-        self.settings_manager.load_settings()
         guild_settings = self.settings_manager.get_guild_settings(guild_id)
         guild_settings["timezone"] = timezone.lower()
         self.settings_manager.update_guild_settings(guild_id, guild_settings)
@@ -455,7 +630,6 @@ class RaidAlert(commands.Cog):
     async def setalertchannel(self, interaction: discord.Interaction, channel: discord.TextChannel):
         guild_id = str(interaction.guild.id)
         locale = self._get_guild_locale(guild_id)
-        self.settings_manager.load_settings()
         current_settings = self.settings_manager.get_guild_settings(guild_id)
         raid_alerts = current_settings.get('raid_alerts', {})
         raid_alerts['channel_id'] = channel.id
@@ -497,8 +671,110 @@ class RaidAlert(commands.Cog):
             locale['commands']['togglealert'][f'success_{state}'], ephemeral=True
         )
 
+    @app_commands.command(name="setalertwindow", description="Set when raid alerts are posted, edited and finished.")
+    #@app_commands.guilds(discord.Object(id=int(os.getenv('GUILD_ID'))))
+    @app_commands.describe(
+        lead_minutes="Minutes before the raid starts to post the alert",
+        edit_interval="Minutes between alert edits",
+        starting_minutes="Minutes before the raid starts to mark it as starting",
+        ongoing_minutes="Minutes after the raid starts to mark it as finished"
+    )
+    @app_commands.checks.has_permissions(administrator=True)
+    async def setalertwindow(
+        self,
+        interaction: discord.Interaction,
+        lead_minutes: app_commands.Range[int, 1, 1440],
+        edit_interval: app_commands.Range[int, 1, 60] = DEFAULT_ALERT_WINDOW.edit_interval_minutes,
+        starting_minutes: app_commands.Range[int, 0, 60] = DEFAULT_ALERT_WINDOW.starting_minutes,
+        ongoing_minutes: app_commands.Range[int, 1, 120] = DEFAULT_ALERT_WINDOW.ongoing_minutes
+    ):
+        guild_id = str(interaction.guild.id)
+        locale = self._get_guild_locale(guild_id)
+        current_settings = self.settings_manager.get_guild_settings(guild_id)
+        raid_alerts = current_settings.get('raid_alerts', {})
+        raid_alerts.update({
+            'lead_minutes': lead_minutes,
+            'edit_interval_minutes': edit_interval,
+            'starting_minutes': starting_minutes,
+            'ongoing_minutes': ongoing_minutes
+        })
+        self.settings_manager.update_guild_settings(guild_id, {'raid_alerts': raid_alerts})
+
+        await interaction.response.send_message(
+            locale['commands']['setalertwindow']['success'].format(
+                lead=lead_minutes, interval=edit_interval, ongoing=ongoing_minutes
+            ),
+            ephemeral=True
+        )
+
+    @app_commands.command(name="setalertretention", description="Set how long finished raid alerts are kept.")
+    #@app_commands.guilds(discord.Object(id=int(os.getenv('GUILD_ID'))))
+    @app_commands.describe(
+        keep_last="Number of finished alerts to keep (0 keeps all)",
+        delete_after_hours="Hours after which finished alerts are deleted (0 never deletes)"
+    )
+    @app_commands.checks.has_permissions(administrator=True)
+    async def setalertretention(
+        self,
+        interaction: discord.Interaction,
+        keep_last: app_commands.Range[int, 0, 1000] = 0,
+        delete_after_hours: app_commands.Range[int, 0, 720] = 0
+    ):
+        guild_id = str(interaction.guild.id)
+        locale = self._get_guild_locale(guild_id)
+        current_settings = self.settings_manager.get_guild_settings(guild_id)
+        raid_alerts = current_settings.get('raid_alerts', {})
+        raid_alerts['retention_keep_last'] = keep_last
+        raid_alerts['retention_hours'] = delete_after_hours
+        self.settings_manager.update_guild_settings(guild_id, {'raid_alerts': raid_alerts})
+        if not keep_last and not delete_after_hours:
+            self.finished_messages.pop(guild_id, None)
+            self.alert_state.mark_dirty()
+
+        await interaction.response.send_message(
+            locale['commands']['setalertretention']['success'].format(
+                keep_last=keep_last, hours=delete_after_hours
+            ),
+            ephemeral=True
+        )
+
+    @app_commands.command(name="nextraids", description="Show the upcoming raid schedule.")
+    #@app_commands.guilds(discord.Object(id=int(os.getenv('GUILD_ID'))))
+    async def nextraids(self, interaction: discord.Interaction):
+        guild_id = str(interaction.guild.id)
+        locale = self._get_guild_locale(guild_id)
+        tz = self._get_guild_timezone(guild_id)
+        raids = self.schedule_projector.upcoming(self._get_current_kst())
+        pages = self._build_next_raids_pages(raids, locale, tz)
+        view = NextRaidsView(pages) if len(pages) > 1 else discord.utils.MISSING
+        await interaction.response.send_message(embed=pages[0], view=view, ephemeral=True)
+
+    def _build_next_raids_pages(self, raids, locale, tz):
+        # One embed per page of upcoming raids, rendered in the guild's timezone
+        texts = locale['commands']['nextraids']
+        title = texts['title'].format(timezone=self._format_gmt_offset(self._get_current_kst().astimezone(tz)))
+        page_size = self.NEXT_RAIDS_PAGE_SIZE
+        chunks = [raids[i:i + page_size] for i in range(0, len(raids), page_size)] or [[]]
+        pages = []
+        for page_number, chunk in enumerate(chunks, start=1):
+            lines = [
+                texts['entry'].format(
+                    time=r["next_time"].astimezone(tz).strftime('%d/%m %H:%M'),
+                    name=r["name"],
+                    location=r["map"]
+                )
+                for r in chunk
+            ]
+            embed = discord.Embed(
+                title=title,
+                description="\n".join(lines) or texts['empty'].format(days=self.NEXT_RAIDS_HORIZON_DAYS),
+                color=0xFF0000
+            )
+            embed.set_footer(text=texts['page'].format(page=page_number, pages=len(chunks)))
+            pages.append(embed)
+        return pages
+
     def _get_guild_timezone(self, guild_id):
-        self.settings_manager.load_settings()
         guild_settings = self.settings_manager.settings.get(str(guild_id), {})
         return self.timezones.get(
             guild_settings.get('timezone'),
@@ -506,31 +782,42 @@ class RaidAlert(commands.Cog):
         )
 
     def _get_guild_locale(self, guild_id):
-        try:
-            self.settings_manager.load_settings()
-            guild_settings = self.settings_manager.settings.get(str(guild_id), {})
-            lang = guild_settings.get('language', 'english').lower()
-            lang_map = {'english': 'en', 'portuguese': 'pt', 'spanish': 'es'}
-            lang_code = lang_map.get(lang, 'en')
-            
-            # Get absolute path to locales directory
-            base_dir = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
-            locale_path = os.path.join(base_dir, 'locales', f'{lang_code}.json')
-            
-            self._log("DEBUG", f"⏳ Loading locale for guild {guild_id}: {lang} -> {locale_path}")
-            
-            if not os.path.exists(locale_path):
-                self._log("ERROR", f"❌ Locale file not found: {locale_path}")
-                raise FileNotFoundError(f"❌ Locale file not found: {locale_path}")
-                
-            with open(locale_path, 'r', encoding='utf-8') as f:
-                locale_data = json.load(f)
-                self._log("DEBUG", f"✅ Loaded locale for {guild_id}: {list(locale_data['raid_alerts'].keys())}")
-                return locale_data
-                
-        except Exception as e:
-            self._log("ERROR", f"❌ Failed to load locale for guild {guild_id}: {str(e)}")
+        guild_settings = self.settings_manager.settings.get(str(guild_id), {})
+        lang = guild_settings.get('language', 'english').lower()
+        lang_map = {'english': 'en', 'portuguese': 'pt', 'spanish': 'es'}
+        lang_code = lang_map.get(lang, 'en')
+        if lang_code not in self.locales:
+            self._log("ERROR", f"❌ Failed to load locale for guild {guild_id}: {lang_code} not found")
             return {}
+        return self.locales[lang_code]
+
+###########################################################
+# Views
+###########################################################
+
+class NextRaidsView(discord.ui.View):
+    def __init__(self, pages, timeout=180):
+        super().__init__(timeout=timeout)
+        self.pages = pages
+        self.page = 0
+        self._sync_buttons()
+
+    def _sync_buttons(self):
+        self.previous_page.disabled = self.page == 0
+        self.next_page.disabled = self.page >= len(self.pages) - 1
+
+    async def _show_page(self, interaction: discord.Interaction, page: int):
+        self.page = max(0, min(page, len(self.pages) - 1))
+        self._sync_buttons()
+        await interaction.response.edit_message(embed=self.pages[self.page], view=self)
+
+    @discord.ui.button(label="◀", style=discord.ButtonStyle.secondary)
+    async def previous_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self._show_page(interaction, self.page - 1)
+
+    @discord.ui.button(label="▶", style=discord.ButtonStyle.secondary)
+    async def next_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self._show_page(interaction, self.page + 1)
 
 ###########################################################
 # Cog Setup
@@ -4,10 +4,15 @@ import asyncio
 from datetime import datetime
 from typing import List
 
+# Imported first so the startup clock covers the remaining imports
+from bot.utils.startup_timings import startup_timings
+
 import discord
 from discord.ext import commands
 from dotenv import load_dotenv
 
+startup_timings.record("imports", startup_timings.since_start())
+
 # Initialize environment variables
 load_dotenv()
 TOKEN = os.getenv('DISCORD_TOKEN')
@@ -30,6 +35,12 @@ intents.message_content = True
 intents.members = True
 bot = commands.Bot(command_prefix='/', intents=intents)
 
+# Independent extensions; blocking work in their cog_load runs in threads so they load concurrently
+COGS: List[str] = [
+    "bot.cogs.language_config",
+    "bot.cogs.raid_alert"
+]
+
 @bot.listen('on_app_command_completion')
 async def log_slash_command(
     interaction: discord.Interaction, 
@@ -43,8 +54,7 @@ async def log_slash_command(
 @bot.command()
 @commands.is_owner()
 async def reload(ctx):
-    cogs = ['bot.cogs.raid_alert', 'bot.cogs.language_config']
-    for ext in cogs:
+    for ext in COGS:
         try:
             await bot.reload_extension(ext)
             logger.info(f'✅ Reloaded [{ext}]')
@@ -62,28 +72,27 @@ async def sync(ctx):
     except Exception as e:
         logger.error(f'❌ Failed to sync commands: {e}')
 
+async def load_cog(cog_path: str) -> None:
+    try:
+        await bot.load_extension(cog_path)
+        logger.info(f"✅ Successfully loaded cog [{cog_path}]")
+    except Exception as error:
+        logger.error(
+            f"❌ Failed to load cog [{cog_path}] - {type(error).__name__}: {error}",
+            exc_info=True
+        )
+
 async def load_cogs() -> None:
-    cogs_to_load: List[str] = [
-        "bot.cogs.language_config",
-        "bot.cogs.raid_alert"
-    ]
-    
     logger.info("Starting cog loading process...")
     
-    for cog_path in cogs_to_load:
-        try:
-            await bot.load_extension(cog_path)
-            logger.info(f"✅ Successfully loaded cog [{cog_path}]")
-        except Exception as error:
-            logger.error(
-                f"❌ Failed to load cog [{cog_path}] - {type(error).__name__}: {error}",
-                exc_info=True
-            )
+    with startup_timings.phase("cog_load"):
+        await asyncio.gather(*(load_cog(cog_path) for cog_path in COGS))
 
 @bot.event
 async def on_ready():
     logger.info(f'Logged in as {bot.user} (ID: {bot.user.id})')
     logger.info(f'Loaded cogs: {list(bot.cogs.keys())}')
+    logger.info(f'Startup timings: {startup_timings.summary()}')
     
     for command in bot.tree.walk_commands():
         # Check if it's a guild-specific command
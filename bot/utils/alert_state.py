@@ -0,0 +1,72 @@
+"""Runtime alert state kept apart from guild settings.
+
+Alerts in flight and finished alert message IDs change every time an alert
+is posted or ends, so they live in their own small JSON file instead of
+server_settings.json. Callers mark the store dirty and the alert loops flush
+it at most once per pass.
+"""
+import json
+import logging
+import os
+from datetime import datetime
+
+logger = logging.getLogger('discord')
+
+class AlertStateStore:
+    """Alert messages that outlive a restart, persisted at ``path``; ``path=None`` keeps them in memory only."""
+
+    def __init__(self, path=None):
+        self.path = path
+        # [{'message_id', 'channel_id', 'status', 'raid'}] for posted alerts that have not finished
+        self.in_flight = []
+        # guild_id -> [{'message_id', 'channel_id', 'finished_at'}], oldest first
+        self.finished = {}
+        self._dirty = False
+
+    def load(self):
+        if not self.path:
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(f"❌ Ignoring unreadable alert state {self.path}: {e}")
+            return
+        self.in_flight = [
+            {**entry, 'raid': {**entry['raid'], 'next_time': datetime.fromisoformat(entry['raid']['next_time'])}}
+            for entry in data.get('in_flight', [])
+        ]
+        self.finished.clear()
+        for guild_id, messages in data.get('finished', {}).items():
+            self.finished[guild_id] = [
+                {**message, 'finished_at': datetime.fromisoformat(message['finished_at'])}
+                for message in messages
+            ]
+
+    def mark_dirty(self):
+        self._dirty = True
+
+    def flush(self):
+        if not self._dirty:
+            return
+        self._dirty = False
+        if not self.path:
+            return
+        data = {'in_flight': [
+            {**entry, 'raid': {**entry['raid'], 'next_time': entry['raid']['next_time'].isoformat()}}
+            for entry in self.in_flight
+        ], 'finished': {
+            guild_id: [{**message, 'finished_at': message['finished_at'].isoformat()} for message in messages]
+            for guild_id, messages in self.finished.items() if messages
+        }}
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            # Keep the changes pending so the next pass retries the write
+            self._dirty = True
+            logger.warning(f"❌ Failed to write alert state {self.path}: {e}")
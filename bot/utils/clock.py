@@ -0,0 +1,24 @@
+from datetime import datetime, timedelta
+
+class SystemClock:
+    """Wall clock used in production."""
+
+    def now(self, tz=None):
+        return datetime.now(tz)
+
+class SimulatedClock:
+    """Manually advanced clock for tests and replays."""
+
+    def __init__(self, start: datetime):
+        if start.tzinfo is None:
+            raise ValueError("SimulatedClock requires a timezone-aware start time")
+        self._now = start
+
+    def now(self, tz=None):
+        return self._now.astimezone(tz) if tz else self._now
+
+    def set(self, moment: datetime) -> None:
+        self._now = moment
+
+    def advance(self, delta: timedelta) -> None:
+        self._now += delta
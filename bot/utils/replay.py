@@ -0,0 +1,189 @@
+"""Replay the raid alert engine against a simulated clock.
+
+Runs the RaidAlert loop logic over days of schedule in seconds and records
+every message send, edit and delete. Usage:
+
+    python -m bot.utils.replay --start 2025-10-20 --days 14 --timezone london
+    python -m bot.utils.replay --start 2025-10-20 --schedule synthetic_schedule.yaml
+"""
+import argparse
+import asyncio
+import itertools
+import time
+from datetime import datetime, timedelta
+from typing import NamedTuple, Optional
+
+import discord
+import pytz
+import yaml
+
+from bot.cogs.raid_alert import RaidAlert
+from bot.utils.alert_state import AlertStateStore
+from bot.utils.clock import SimulatedClock
+from bot.utils.settings_backends import MemorySettingsBackend
+from bot.utils.settings_manager import SettingsManager
+
+KST = pytz.timezone("Asia/Seoul")
+TICK = timedelta(seconds=10)
+RETENTION_INTERVAL = timedelta(minutes=10)
+
+class ReplayEvent(NamedTuple):
+    time: datetime
+    action: str  # "send", "edit" or "delete"
+    guild_id: str
+    channel_id: int
+    message_id: int
+    content: Optional[str] = None
+    color: Optional[int] = None
+
+class ReplayMessage:
+    def __init__(self, channel, message_id, content, embed):
+        self.channel = channel
+        self.id = message_id
+        self.content = content
+        self.embed = embed
+
+    async def edit(self, content=None, embed=None, **kwargs):
+        self.content = content
+        self.embed = embed
+        self.channel._record("edit", self)
+
+    async def delete(self):
+        self.channel.messages.pop(self.id, None)
+        self.channel._record("delete", self)
+
+class ReplayChannel:
+    def __init__(self, replay, guild_id, channel_id):
+        self.replay = replay
+        self.guild_id = str(guild_id)
+        self.id = channel_id
+        self.messages = {}
+
+    def _record(self, action, message):
+        color = message.embed.color.value if message.embed and message.embed.color else None
+        self.replay.events.append(ReplayEvent(
+            self.replay.clock.now(), action, self.guild_id, self.id, message.id, message.content, color
+        ))
+
+    async def send(self, content=None, embed=None, **kwargs):
+        message = ReplayMessage(self, self.replay.next_message_id(), content, embed)
+        self.messages[message.id] = message
+        self._record("send", message)
+        return message
+
+    async def fetch_message(self, message_id):
+        if message_id not in self.messages:
+            raise discord.NotFound(_FakeResponse(404), "Unknown Message")
+        return self.messages[message_id]
+
+    def get_partial_message(self, message_id):
+        return self.messages.get(message_id) or ReplayMessage(self, message_id, None, None)
+
+    async def delete_messages(self, messages):
+        for message in messages:
+            await self.get_partial_message(message.id).delete()
+
+class _FakeResponse:
+    def __init__(self, status):
+        self.status = status
+        self.reason = "Replay"
+
+class ReplayBot:
+    def __init__(self, replay):
+        self.replay = replay
+
+    def get_channel(self, channel_id):
+        return self.replay.channels.get(channel_id)
+
+    async def wait_until_ready(self):
+        pass
+
+class AlertReplay:
+    """Drives a RaidAlert cog tick by tick on a simulated clock.
+
+    ``guilds`` maps guild ids to guild settings as stored by SettingsManager;
+    each enabled guild gets a recording channel for its ``channel_id``.
+    ``raids`` replaces raid_schedule.yaml with a recorded or synthetic schedule.
+    """
+
+    def __init__(self, start: datetime, guilds: dict, raids=None):
+        self.clock = SimulatedClock(start)
+        self.events = []
+        self._message_ids = itertools.count(1)
+        self.channels = {}
+        for guild_id, guild_settings in guilds.items():
+            channel_id = guild_settings.get('raid_alerts', {}).get('channel_id')
+            if channel_id:
+                self.channels[channel_id] = ReplayChannel(self, guild_id, channel_id)
+        self.cog = RaidAlert(
+            ReplayBot(self), clock=self.clock, settings=SettingsManager(MemorySettingsBackend(guilds)), snapshot=False,
+            alert_state=AlertStateStore()
+        )
+        self.cog._load_state()
+        if raids is not None:
+            self.cog._set_raids(raids)
+
+    def next_message_id(self):
+        # Snowflakes from simulated time keep bulk-delete age checks meaningful
+        return discord.utils.time_snowflake(self.clock.now()) + next(self._message_ids)
+
+    def _next_delta(self, next_retention):
+        # Skip idle stretches in whole ticks until the next raid enters any window
+        if self.cog.sent_messages:
+            return TICK
+        now = self.clock.now()
+        upcoming = self.cog.schedule_projector.upcoming(now, limit=1)
+        if not upcoming:
+            return TICK
+        enabled_guilds = self.cog.settings_manager.get_enabled_guilds()
+        max_lead = max((self.cog._get_alert_window(g).lead_minutes for g in enabled_guilds), default=0)
+        wake_at = min(upcoming[0]["next_time"] - timedelta(minutes=max_lead), next_retention)
+        return max(TICK, ((wake_at - now) // TICK) * TICK)
+
+    async def run(self, end: datetime):
+        next_retention = self.clock.now()
+        while self.clock.now() < end:
+            await RaidAlert._raid_alert_loop.coro(self.cog)
+            if self.clock.now() >= next_retention:
+                await RaidAlert._message_retention_loop.coro(self.cog)
+                next_retention += RETENTION_INTERVAL
+            self.clock.advance(self._next_delta(next_retention))
+        return self.events
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Replay raid alerts on a simulated clock.")
+    parser.add_argument("--start", required=True, help="Start date in KST (YYYY-MM-DD)")
+    parser.add_argument("--days", type=int, default=7)
+    parser.add_argument("--timezone", default="korea")
+    parser.add_argument("--language", default="english")
+    parser.add_argument("--lead", type=int, default=15, help="Lead time in minutes")
+    parser.add_argument("--schedule", help="Raid schedule YAML to replay instead of raid_schedule.yaml")
+    parser.add_argument("--quiet", action="store_true", help="Only print the summary")
+    args = parser.parse_args()
+
+    guilds = {"1": {
+        "timezone": args.timezone,
+        "language": args.language,
+        "raid_alerts": {"enabled": True, "channel_id": 1, "role_id": 1, "lead_minutes": args.lead}
+    }}
+    start = KST.localize(datetime.strptime(args.start, "%Y-%m-%d"))
+    raids = None
+    if args.schedule:
+        with open(args.schedule, "r", encoding="utf-8") as f:
+            raids = yaml.safe_load(f)["raids"]
+    replay = AlertReplay(start, guilds, raids=raids)
+    end = replay.clock.now() + timedelta(days=args.days)
+    wall_start = time.perf_counter()
+    events = asyncio.run(replay.run(end))
+    elapsed = time.perf_counter() - wall_start
+
+    if not args.quiet:
+        for event in events:
+            summary = (event.content or "").splitlines()[-1] if event.content else ""
+            print(f"{event.time:%Y-%m-%d %H:%M:%S} {event.action:<6} #{event.message_id} {summary}")
+    counts = {action: sum(1 for e in events if e.action == action) for action in ("send", "edit", "delete")}
+    speedup = timedelta(days=args.days).total_seconds() / max(elapsed, 1e-9)
+    print(f"Replayed {args.days} days in {elapsed:.2f}s ({speedup:,.0f}x real time): {counts}")
+
+if __name__ == '__main__':
+    main()
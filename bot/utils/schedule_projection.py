@@ -0,0 +1,114 @@
+import hashlib
+import json
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta
+
+# Rotation raids shift 25 minutes later every day
+ROTATION_STEP = timedelta(days=1, minutes=25)
+BIWEEKLY_PERIOD_DAYS = 14
+
+
+class ScheduleProjector:
+    """Projects every raid_schedule.yaml entry over a horizon of days.
+
+    Occurrences are computed in closed form and cached until the schedule
+    fingerprint or the current day (in the schedule timezone) changes. The
+    timeline starts at yesterday's midnight so raids still ongoing shortly
+    after midnight remain visible.
+    """
+
+    def __init__(self, raids, tz, horizon_days=7):
+        self.tz = tz
+        self.horizon_days = horizon_days
+        self._cache_key = None
+        self._timeline = []
+        self._times = []
+        self.set_schedule(raids)
+
+    def set_schedule(self, raids):
+        self.raids = raids
+        payload = json.dumps(raids, sort_keys=True, default=str)
+        self.fingerprint = hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+    def project(self, now):
+        # Timeline from yesterday's midnight up to the end of the horizon
+        start_date = now.astimezone(self.tz).date()
+        key = (self.fingerprint, start_date, self.horizon_days)
+        if key != self._cache_key:
+            self._timeline = self._build_timeline(start_date)
+            self._times = [r["next_time"] for r in self._timeline]
+            self._cache_key = key
+        return self._timeline
+
+    def export_cache(self):
+        return self._cache_key, self._timeline
+
+    def restore_cache(self, cache_key, timeline):
+        # Reuse a previously projected timeline if it matches this schedule
+        if cache_key and cache_key[0] == self.fingerprint:
+            self._cache_key = cache_key
+            self._timeline = timeline
+            self._times = [r["next_time"] for r in timeline]
+
+    def upcoming(self, now, limit=None):
+        timeline = self.project(now)
+        index = bisect_right(self._times, now)
+        end = None if limit is None else index + limit
+        return timeline[index:end]
+
+    def window(self, now, lead, ongoing):
+        # Occurrences starting between now - ongoing and now + lead (timedeltas)
+        timeline = self.project(now)
+        start = bisect_left(self._times, now - ongoing)
+        end = bisect_right(self._times, now + lead)
+        return timeline[start:end]
+
+    ###########################################################
+    # Closed-form occurrence generators
+    ###########################################################
+
+    def _build_timeline(self, start_date):
+        midnight = datetime.combine(start_date, datetime.min.time())
+        start = midnight - timedelta(days=1)
+        end = midnight + timedelta(days=self.horizon_days)
+        timeline = []
+        for cfg in self.raids:
+            freq = cfg.get("frequency", "daily")
+            times = cfg.get("times", [])
+            if freq == "rotation":
+                base_time = times[0]
+                occurrences = ((dt, base_time) for dt in self._rotation_times(cfg, start, end))
+            elif freq == "biweekly":
+                occurrences = self._periodic_times(times, start, end, cfg["base_date"], BIWEEKLY_PERIOD_DAYS)
+            else:
+                occurrences = self._periodic_times(times, start, end, None, 1)
+            for dt, scheduled_time in occurrences:
+                timeline.append({
+                    "name": cfg["name"],
+                    "map": cfg["map"],
+                    "next_time": self.tz.localize(dt),
+                    "scheduled_time": scheduled_time,
+                })
+        timeline.sort(key=lambda r: r["next_time"])
+        return timeline
+
+    def _periodic_times(self, times, start, end, base_date_str, period_days):
+        first_day = start
+        if base_date_str:
+            base = datetime.strptime(base_date_str, "%Y-%m-%d")
+            first_day += timedelta(days=(base - start).days % period_days)
+        parsed = [(t, datetime.strptime(t, "%H:%M").time()) for t in times]
+        day = first_day
+        while day < end:
+            for t, raid_time in parsed:
+                yield datetime.combine(day.date(), raid_time), t
+            day += timedelta(days=period_days)
+
+    def _rotation_times(self, cfg, start, end):
+        base = datetime.strptime(f"{cfg['base_date']} {cfg['times'][0]}", "%Y-%m-%d %H:%M")
+        # First rotation index k with base + k * step >= start (ceil division)
+        k = -((base - start) // ROTATION_STEP)
+        raid_dt = base + k * ROTATION_STEP
+        while raid_dt < end:
+            yield raid_dt
+            raid_dt += ROTATION_STEP
@@ -0,0 +1,118 @@
+import json
+import os
+import sqlite3
+
+class MemorySettingsBackend:
+    """All guilds in a dict, never written anywhere. Used by replays and tests."""
+
+    def __init__(self, settings: dict = None):
+        self._data = dict(settings or {})
+
+    def load_all(self) -> dict:
+        return self._data
+
+    def update_guild(self, guild_id: str, new_settings: dict) -> dict:
+        merged = {**self._data.get(guild_id, {}), **new_settings}
+        self._data[guild_id] = merged
+        return merged
+
+    def enabled_guild_ids(self) -> list:
+        return [
+            guild_id for guild_id, config in self._data.items()
+            if config.get('raid_alerts', {}).get('enabled', False)
+        ]
+
+class JsonSettingsBackend(MemorySettingsBackend):
+    """All guilds in one JSON file, rewritten on every update. Fine for small deployments."""
+
+    def __init__(self, path: str):
+        super().__init__()
+        self.path = path
+
+    def load_all(self) -> dict:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self._data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self._data = {}
+        return self._data
+
+    def _write(self) -> None:
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump(self._data, f, indent=4)
+
+    def update_guild(self, guild_id: str, new_settings: dict) -> dict:
+        merged = super().update_guild(guild_id, new_settings)
+        self._write()
+        return merged
+
+class SqliteSettingsBackend:
+    """One row per guild with an index on raid_alerts.enabled.
+
+    On first use the schema is created and, if ``json_path`` exists, its
+    guilds are imported once; ``PRAGMA user_version`` records the migration.
+    """
+
+    SCHEMA_VERSION = 1
+
+    def __init__(self, path: str, json_path: str = None):
+        self.path = path
+        # Autocommit mode; writes open their own transactions
+        self.conn = sqlite3.connect(path, isolation_level=None)
+        self._migrate(json_path)
+
+    def _migrate(self, json_path):
+        if self.conn.execute("PRAGMA user_version").fetchone()[0] >= self.SCHEMA_VERSION:
+            return
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS guild_settings ("
+                "guild_id TEXT PRIMARY KEY, "
+                "settings TEXT NOT NULL, "
+                "raid_alerts_enabled INTEGER NOT NULL DEFAULT 0)"
+            )
+            self.conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_guild_settings_raid_alerts_enabled "
+                "ON guild_settings (raid_alerts_enabled)"
+            )
+            if json_path and os.path.exists(json_path):
+                for guild_id, settings in JsonSettingsBackend(json_path).load_all().items():
+                    self._upsert(guild_id, settings)
+            self.conn.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+
+    def _upsert(self, guild_id: str, settings: dict) -> None:
+        enabled = int(bool(settings.get('raid_alerts', {}).get('enabled', False)))
+        self.conn.execute(
+            "INSERT INTO guild_settings (guild_id, settings, raid_alerts_enabled) VALUES (?, ?, ?) "
+            "ON CONFLICT(guild_id) DO UPDATE SET "
+            "settings = excluded.settings, raid_alerts_enabled = excluded.raid_alerts_enabled",
+            (str(guild_id), json.dumps(settings), enabled)
+        )
+
+    def load_all(self) -> dict:
+        rows = self.conn.execute("SELECT guild_id, settings FROM guild_settings")
+        return {guild_id: json.loads(settings) for guild_id, settings in rows}
+
+    def update_guild(self, guild_id: str, new_settings: dict) -> dict:
+        # Read-merge-write of a single row in one transaction
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = self.conn.execute(
+                "SELECT settings FROM guild_settings WHERE guild_id = ?", (guild_id,)
+            ).fetchone()
+            merged = {**(json.loads(row[0]) if row else {}), **new_settings}
+            self._upsert(guild_id, merged)
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+        return merged
+
+    def enabled_guild_ids(self) -> list:
+        rows = self.conn.execute("SELECT guild_id FROM guild_settings WHERE raid_alerts_enabled = 1")
+        return [guild_id for (guild_id,) in rows]
@@ -1,34 +1,48 @@
-import json
+import os
+from bot.utils.startup_timings import startup_timings
+from bot.utils.settings_backends import JsonSettingsBackend, SqliteSettingsBackend
 
 class SettingsManager:
     _instance = None
     SETTINGS_FILE = 'server_settings.json'
-    
-    def __new__(cls):
+    SETTINGS_DB = 'server_settings.db'
+
+    def __new__(cls, backend=None):
+        # An injected backend gets its own manager (replays, tests); otherwise the shared singleton
+        if backend is not None:
+            manager = super(SettingsManager, cls).__new__(cls)
+            manager._attach(backend)
+            return manager
         if cls._instance is None:
             cls._instance = super(SettingsManager, cls).__new__(cls)
-            cls._instance.load_settings()
+            cls._instance._attach(cls._create_backend())
         return cls._instance
-    
+
+    def _attach(self, backend):
+        self.backend = backend
+        self.load_settings()
+
+    @classmethod
+    def _create_backend(cls):
+        # SETTINGS_BACKEND=sqlite for large installs; JSON file by default
+        if os.getenv('SETTINGS_BACKEND', 'json').lower() == 'sqlite':
+            return SqliteSettingsBackend(os.getenv('SETTINGS_DB', cls.SETTINGS_DB), json_path=cls.SETTINGS_FILE)
+        return JsonSettingsBackend(cls.SETTINGS_FILE)
+
     def load_settings(self):
-        try:
-            with open(self.SETTINGS_FILE, 'r', encoding='utf-8') as f:
-                self.settings = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            self.settings = {}
-    
-    def _save_settings(self):
-        with open(self.SETTINGS_FILE, 'w', encoding='utf-8') as f:
-            json.dump(self.settings, f, indent=4)
-    
+        self.settings = self.backend.load_all()
+
     def get_guild_settings(self, guild_id: str):
         return self.settings.get(str(guild_id), {})
-    
+
     def update_guild_settings(self, guild_id: str, new_settings: dict):
         guild_id = str(guild_id)
-        current = self.get_guild_settings(guild_id)
-        self.settings[guild_id] = {**current, **new_settings}
-        self._save_settings()
+        self.settings[guild_id] = self.backend.update_guild(guild_id, new_settings)
+
+    def get_enabled_guilds(self):
+        # Guild ids with raid alerts enabled
+        return self.backend.enabled_guild_ids()
 
 # Singleton instance for all cogs to use
-settings_manager = SettingsManager()
+with startup_timings.phase("settings_load"):
+    settings_manager = SettingsManager()
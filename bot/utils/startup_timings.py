@@ -0,0 +1,29 @@
+import time
+from contextlib import contextmanager
+
+class StartupTimings:
+    """Wall-clock durations of each startup phase, measured from process start."""
+
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        self.phases = {}
+
+    def since_start(self) -> float:
+        return time.perf_counter() - self.started_at
+
+    def record(self, phase: str, seconds: float) -> None:
+        self.phases[phase] = seconds
+
+    @contextmanager
+    def phase(self, phase: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(phase, time.perf_counter() - start)
+
+    def summary(self) -> str:
+        return " | ".join(f"{phase}={seconds:.3f}s" for phase, seconds in self.phases.items())
+
+# Singleton instance, created on first import so imports can be timed
+startup_timings = StartupTimings()
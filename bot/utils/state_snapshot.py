@@ -0,0 +1,49 @@
+import glob
+import logging
+import os
+import pickle
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+SCHEDULE_PATH = os.path.join(BASE_DIR, "raid_schedule.yaml")
+LOCALES_DIR = os.path.join(BASE_DIR, "locales")
+SNAPSHOT_PATH = os.path.join(BASE_DIR, ".cache", "state_snapshot.pickle")
+# Bump whenever the snapshot layout changes
+SNAPSHOT_VERSION = 1
+
+logger = logging.getLogger('discord')
+
+def source_signature():
+    # Snapshot stays valid while no source file is added, removed or modified
+    paths = [SCHEDULE_PATH] + sorted(glob.glob(os.path.join(LOCALES_DIR, "*.json")))
+    signature = [SNAPSHOT_VERSION]
+    for path in paths:
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            signature.append((path, None, None))
+            continue
+        signature.append((path, stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
+
+def load_snapshot(signature):
+    try:
+        with open(SNAPSHOT_PATH, "rb") as f:
+            snapshot = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"❌ Ignoring unreadable state snapshot {SNAPSHOT_PATH}: {e}")
+        return None
+    if not isinstance(snapshot, dict) or snapshot.get("signature") != signature:
+        return None
+    return snapshot
+
+def save_snapshot(signature, state):
+    tmp_path = f"{SNAPSHOT_PATH}.tmp"
+    try:
+        os.makedirs(os.path.dirname(SNAPSHOT_PATH), exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            pickle.dump({**state, "signature": signature}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, SNAPSHOT_PATH)
+    except OSError as e:
+        logger.warning(f"❌ Failed to write state snapshot {SNAPSHOT_PATH}: {e}")
@@ -0,0 +1,28 @@
+import pytest
+from unittest.mock import MagicMock
+from bot.cogs.raid_alert import RaidAlert
+from bot.utils.alert_state import AlertStateStore
+from bot.utils.settings_backends import MemorySettingsBackend
+from bot.utils.settings_manager import SettingsManager
+
+@pytest.fixture
+def settings_store():
+    # In-memory settings so tests never touch server_settings.json or the database
+    return SettingsManager(MemorySettingsBackend())
+
+@pytest.fixture
+def alert_state():
+    # In-memory alert state shared by every cog a test builds, like a restart would see
+    return AlertStateStore()
+
+@pytest.fixture
+def make_cog(settings_store, alert_state):
+    def _make_cog(**kwargs):
+        kwargs.setdefault("snapshot", False)
+        kwargs.setdefault("alert_state", alert_state)
+        cog = RaidAlert(MagicMock(), settings=settings_store, **kwargs)
+        # cog_load normally does this in a worker thread
+        cog._load_state()
+        cog._load_alert_state()
+        return cog
+    return _make_cog
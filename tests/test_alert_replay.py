@@ -0,0 +1,61 @@
+import asyncio
+import pytz
+from datetime import datetime, timedelta
+from bot.utils.replay import AlertReplay
+
+KST = pytz.timezone("Asia/Seoul")
+
+def _replay(start, days, **raid_alerts):
+    guilds = {"1": {
+        "timezone": "london",
+        "raid_alerts": {"enabled": True, "channel_id": 10, "role_id": 20, **raid_alerts}
+    }}
+    replay = AlertReplay(start, guilds)
+    asyncio.run(replay.run(start + timedelta(days=days)))
+    return replay
+
+def test_replay_sends_once_and_finishes_every_alert():
+    replay = _replay(KST.localize(datetime(2025, 9, 10)), 2)
+    sends = [e for e in replay.events if e.action == "send"]
+    assert sends
+
+    for send in sends:
+        edits = [e for e in replay.events if e.message_id == send.message_id and e.action == "edit"]
+        assert edits[-1].color == 0x808080
+        assert edits[-1].time - send.time < timedelta(minutes=25)
+
+def test_replay_first_post_respects_lead_time():
+    replay = _replay(KST.localize(datetime(2025, 9, 10)), 1, lead_minutes=30)
+    pumpkinmon = [e for e in replay.events if e.action == "send" and "PUMPKINMON" in e.content]
+    assert [e.time for e in pumpkinmon] == [
+        KST.localize(datetime(2025, 9, 10, 18, 0)),
+        KST.localize(datetime(2025, 9, 10, 20, 0)),
+    ]
+
+def test_replay_renders_guild_time_across_dst_change():
+    replay = _replay(KST.localize(datetime(2025, 10, 25)), 2)
+    omnimon_times = [
+        m.embed.fields[1].value for m in replay.channels[10].messages.values() if m.embed.title == "Omnimon"
+    ]
+    # 20:00 KST is 12:00 BST before the London DST change and 11:00 GMT after
+    assert omnimon_times == ["⏰ 12:00 (GMT+1)", "⏰ 11:00 (GMT+0)"]
+
+def test_replay_synthetic_rotation_and_biweekly_schedule():
+    raids = [
+        {"name": "🪽 Andromon", "map": "Gear Savannah", "frequency": "rotation", "base_date": "2025-09-01",
+         "times": ["12:00"], "image": "Andromon.png", "map_image": "Andromon_map.jpg"},
+        {"name": "🪨 Gotsumon", "map": "Campground", "frequency": "biweekly", "base_date": "2025-09-01",
+         "times": ["19:00"], "image": "Gotsumon.png", "map_image": "Gotsumon_map.jpg"},
+    ]
+    start = KST.localize(datetime(2025, 9, 14))
+    replay = AlertReplay(start, {"1": {"raid_alerts": {"enabled": True, "channel_id": 10, "role_id": 20}}}, raids=raids)
+    asyncio.run(replay.run(start + timedelta(days=3)))
+
+    sends = [(e.time, e.content.splitlines()[1].split(" | ")[0]) for e in replay.events if e.action == "send"]
+    # Rotation shifts 25 minutes a day (13 days after base: 17:25); biweekly fires every 14 days
+    assert sends == [
+        (KST.localize(datetime(2025, 9, 14, 17, 10)), "**🪽 ANDROMON**"),
+        (KST.localize(datetime(2025, 9, 15, 17, 35)), "**🪽 ANDROMON**"),
+        (KST.localize(datetime(2025, 9, 15, 18, 45)), "**🪨 GOTSUMON**"),
+        (KST.localize(datetime(2025, 9, 16, 18, 0)), "**🪽 ANDROMON**"),
+    ]
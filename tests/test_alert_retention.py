@@ -0,0 +1,146 @@
+import asyncio
+import discord
+import pytest
+import pytz
+from unittest.mock import AsyncMock, MagicMock
+from bot.cogs.raid_alert import RaidAlert
+from bot.utils.alert_state import AlertStateStore
+from bot.utils.clock import SimulatedClock
+from datetime import datetime, timedelta
+
+KST = pytz.timezone("Asia/Seoul")
+
+@pytest.fixture
+def cog(make_cog):
+    return make_cog()
+
+def _finished(count, start):
+    return [
+        {"message_id": i, "channel_id": 10, "finished_at": start + timedelta(hours=i)}
+        for i in range(count)
+    ]
+
+def test_keep_last_expires_oldest_messages(cog):
+    now = cog.default_tz.localize(datetime(2025, 9, 10, 12, 0))
+    finished = _finished(5, now - timedelta(hours=5))
+
+    expired = cog._select_expired_messages(finished, 2, 0, now)
+    assert [m["message_id"] for m in expired] == [0, 1, 2]
+
+def test_age_and_keep_last_combine(cog):
+    now = cog.default_tz.localize(datetime(2025, 9, 10, 12, 0))
+    finished = _finished(5, now - timedelta(hours=5))
+
+    assert [m["message_id"] for m in cog._select_expired_messages(finished, 0, 3, now)] == [0, 1, 2]
+    assert [m["message_id"] for m in cog._select_expired_messages(finished, 4, 2, now)] == [0, 1, 2, 3]
+
+def test_finished_messages_untracked_without_policy(cog):
+    now = cog.default_tz.localize(datetime(2025, 9, 10, 12, 0))
+    cog._track_finished_message("7", {"message_id": 1, "channel_id": 10}, now)
+    assert cog.finished_messages == {}
+
+    cog.settings_manager.update_guild_settings("7", {"raid_alerts": {"retention_keep_last": 1}})
+    cog._track_finished_message("7", {"message_id": 1, "channel_id": 10}, now)
+    assert cog.finished_messages["7"][0]["message_id"] == 1
+
+def test_bulk_delete_batches_recent_messages(cog):
+    channel = MagicMock()
+    channel.delete_messages = AsyncMock()
+    cog.bot.get_channel.return_value = channel
+    recent_id = discord.utils.time_snowflake(discord.utils.utcnow())
+    message_ids = [recent_id + i for i in range(250)]
+
+    deleted = asyncio.run(cog._bulk_delete_messages(10, message_ids))
+
+    assert [len(call.args[0]) for call in channel.delete_messages.call_args_list] == [100, 100, 50]
+    assert deleted == set(message_ids)
+
+def _http_error(exc_type, status):
+    response = MagicMock(status=status, reason="")
+    return exc_type(response, "")
+
+def test_failed_deletes_stay_queued_for_retry(make_cog):
+    now = KST.localize(datetime(2025, 9, 10, 12, 0))
+    clock = SimulatedClock(now)
+    cog = make_cog(clock=clock)
+    cog.settings_manager.update_guild_settings("7", {"raid_alerts": {"retention_hours": 1}})
+    first_id = discord.utils.time_snowflake(now)
+    message_ids = [first_id + i for i in range(3)]
+    for message_id in message_ids:
+        cog._track_finished_message("7", {"message_id": message_id, "channel_id": 10}, now)
+
+    channel = MagicMock()
+    channel.delete_messages = AsyncMock(side_effect=_http_error(discord.HTTPException, 503))
+    cog.bot.get_channel.return_value = channel
+    clock.advance(timedelta(hours=2))
+    asyncio.run(RaidAlert._message_retention_loop.coro(cog))
+    assert [m["message_id"] for m in cog.finished_messages["7"]] == message_ids
+
+    # Messages someone already removed count as deleted
+    channel.delete_messages.side_effect = _http_error(discord.NotFound, 404)
+    asyncio.run(RaidAlert._message_retention_loop.coro(cog))
+    assert cog.finished_messages["7"] == []
+
+def test_tracked_messages_survive_cog_reload(cog, make_cog):
+    now = cog.default_tz.localize(datetime(2025, 9, 10, 12, 0))
+    cog.settings_manager.update_guild_settings("7", {"raid_alerts": {"retention_hours": 1}})
+    cog._track_finished_message("7", {"message_id": 1, "channel_id": 10}, now)
+
+    clock = SimulatedClock(now)
+    reloaded = make_cog(clock=clock)
+    assert reloaded.finished_messages["7"] == [{"message_id": 1, "channel_id": 10, "finished_at": now}]
+
+    channel = MagicMock()
+    channel.get_partial_message.return_value.delete = AsyncMock()
+    reloaded.bot.get_channel.return_value = channel
+    clock.advance(timedelta(hours=2))
+    asyncio.run(RaidAlert._message_retention_loop.coro(reloaded))
+
+    assert reloaded.finished_messages["7"] == []
+    assert "finished_alerts" not in reloaded.settings_manager.get_guild_settings("7")
+
+def test_alert_state_written_once_per_pass(tmp_path, make_cog):
+    path = tmp_path / "alert_state.json"
+    cog = make_cog(alert_state=AlertStateStore(str(path)))
+    now = cog.default_tz.localize(datetime(2025, 9, 10, 12, 0))
+    cog.settings_manager.update_guild_settings("7", {"raid_alerts": {"retention_keep_last": 5}})
+    for message_id in (1, 2):
+        cog._track_finished_message("7", {"message_id": message_id, "channel_id": 10}, now)
+    assert not path.exists()
+
+    cog.alert_state.flush()
+    restored = AlertStateStore(str(path))
+    restored.load()
+    assert [m["message_id"] for m in restored.finished["7"]] == [1, 2]
+    assert restored.finished["7"][0]["finished_at"] == now
+
+def test_alert_in_flight_at_shutdown_is_finished_and_cleaned_up(make_cog):
+    clock = SimulatedClock(KST.localize(datetime(2025, 9, 10, 19, 50)))
+    cog = make_cog(clock=clock)
+    cog._set_raids([{"name": "🎲 Omnimon", "map": "Gear Savannah", "frequency": "daily", "times": ["20:00"],
+                     "image": "Omnimon.png", "map_image": "Omnimon_map.jpg"}])
+    cog.settings_manager.update_guild_settings("1", {"raid_alerts": {
+        "enabled": True, "channel_id": 10, "role_id": 99, "retention_hours": 1
+    }})
+    message_id = discord.utils.time_snowflake(clock.now())
+    channel = MagicMock()
+    channel.send = AsyncMock(return_value=MagicMock(id=message_id))
+    cog.bot.get_channel.return_value = channel
+    asyncio.run(RaidAlert._raid_alert_loop.coro(cog))
+
+    # Offline across the whole raid
+    clock.advance(timedelta(hours=1))
+    restarted = make_cog(clock=clock)
+    restarted.bot.get_channel.return_value = channel
+    channel.fetch_message = AsyncMock(return_value=MagicMock(edit=AsyncMock()))
+    asyncio.run(RaidAlert._raid_alert_loop.coro(restarted))
+
+    assert restarted.finished_messages["1"] == [{
+        "message_id": message_id, "channel_id": 10, "finished_at": KST.localize(datetime(2025, 9, 10, 20, 5))
+    }]
+    # Due an hour after the raid ended, not an hour after the restart
+    channel.delete_messages = AsyncMock()
+    clock.advance(timedelta(minutes=20))
+    asyncio.run(RaidAlert._message_retention_loop.coro(restarted))
+    assert channel.delete_messages.call_args.args[0][0].id == message_id
+    assert restarted.finished_messages["1"] == []
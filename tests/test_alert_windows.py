@@ -0,0 +1,89 @@
+import asyncio
+import pytest
+import pytz
+from unittest.mock import AsyncMock, MagicMock, patch
+from bot.cogs.raid_alert import RaidAlert, AlertWindow, DEFAULT_ALERT_WINDOW
+from bot.utils.alert_state import AlertStateStore
+from bot.utils.clock import SimulatedClock
+from datetime import datetime, timedelta
+
+KST = pytz.timezone("Asia/Seoul")
+
+OMNIMON_ONLY = [{"name": "🎲 Omnimon", "map": "Gear Savannah", "frequency": "daily", "times": ["20:00"],
+                 "image": "Omnimon.png", "map_image": "Omnimon_map.jpg"}]
+
+@pytest.fixture
+def cog(make_cog):
+    cog = make_cog()
+    cog._set_raids(OMNIMON_ONLY)
+    return cog
+
+@pytest.mark.parametrize("time_diff,window,expected", [
+    (600, DEFAULT_ALERT_WINDOW, "upcoming"),
+    (240, DEFAULT_ALERT_WINDOW, "starting"),
+    (-200, DEFAULT_ALERT_WINDOW, "ongoing"),
+    (-400, DEFAULT_ALERT_WINDOW, "finished"),
+    (600, AlertWindow(starting_minutes=10), "starting"),
+    (-400, AlertWindow(ongoing_minutes=10), "ongoing"),
+])
+def test_status_uses_alert_window(cog, time_diff, window, expected):
+    assert cog._compute_status(time_diff, window) == expected
+
+def test_alert_window_read_from_guild_settings(cog):
+    cog.settings_manager.update_guild_settings("42", {"raid_alerts": {"lead_minutes": 30, "edit_interval_minutes": 2}})
+
+    assert cog._get_alert_window("42") == AlertWindow(lead_minutes=30, edit_interval_minutes=2)
+    assert cog._get_alert_window("missing") == DEFAULT_ALERT_WINDOW
+
+def test_loop_posts_only_inside_each_guild_window(make_cog):
+    now = KST.localize(datetime(2025, 9, 10, 19, 30))
+    cog = make_cog(clock=SimulatedClock(now))
+    cog._set_raids(OMNIMON_ONLY)
+    channels = {}
+    for guild_id, lead, edit_interval in (("1", 15, 1), ("2", 60, 1), ("3", 60, 5)):
+        channel = MagicMock()
+        channel.send = AsyncMock(return_value=MagicMock(id=int(guild_id)))
+        channels[int(guild_id)] = channel
+        cog.settings_manager.update_guild_settings(guild_id, {"raid_alerts": {
+            "enabled": True, "channel_id": int(guild_id), "role_id": 99,
+            "lead_minutes": lead, "edit_interval_minutes": edit_interval
+        }})
+    cog.bot.get_channel.side_effect = channels.get
+
+    with patch.object(cog.schedule_projector, "window", wraps=cog.schedule_projector.window) as window:
+        asyncio.run(RaidAlert._raid_alert_loop.coro(cog))
+
+    # Guilds 2 and 3 differ only in edit interval, so they share one timeline slice
+    assert window.call_count == 2
+    assert not channels[1].send.called
+    assert channels[2].send.called and channels[3].send.called
+    assert ("2", "🎲 Omnimon", "2025-09-10 20:00:00") in cog.sent_messages
+
+def test_restart_edits_in_flight_alert_instead_of_posting_again(tmp_path, make_cog):
+    path = str(tmp_path / "alert_state.json")
+    clock = SimulatedClock(KST.localize(datetime(2025, 9, 10, 19, 50)))
+    cog = make_cog(clock=clock, alert_state=AlertStateStore(path))
+    cog._set_raids(OMNIMON_ONLY)
+    cog.settings_manager.update_guild_settings("1", {"raid_alerts": {"enabled": True, "channel_id": 10, "role_id": 99}})
+    channel = MagicMock()
+    channel.send = AsyncMock(return_value=MagicMock(id=555))
+    cog.bot.get_channel.return_value = channel
+    asyncio.run(RaidAlert._raid_alert_loop.coro(cog))
+
+    clock.advance(timedelta(minutes=12))
+    restarted = make_cog(clock=clock, alert_state=AlertStateStore(path))
+    restarted._set_raids(OMNIMON_ONLY)
+    restarted.bot.get_channel.return_value = channel
+    message = MagicMock(edit=AsyncMock())
+    channel.fetch_message = AsyncMock(return_value=message)
+    asyncio.run(RaidAlert._raid_alert_loop.coro(restarted))
+
+    assert channel.send.call_count == 1
+    channel.fetch_message.assert_awaited_with(555)
+    assert restarted.sent_messages[("1", "🎲 Omnimon", "2025-09-10 20:00:00")]["status"] == "ongoing"
+
+    clock.advance(timedelta(minutes=5))
+    asyncio.run(RaidAlert._raid_alert_loop.coro(restarted))
+    assert message.edit.call_args.kwargs["embed"].color.value == 0x808080
+    assert restarted.sent_messages == {}
+    assert channel.send.call_count == 1
@@ -0,0 +1,62 @@
+import pytz
+from datetime import datetime, timedelta
+from bot.utils.schedule_projection import ScheduleProjector
+
+KST = pytz.timezone("Asia/Seoul")
+
+RAIDS = [
+    {"name": "🎃 Pumpkinmon", "map": "Shibuya", "frequency": "daily", "times": ["18:30", "20:30"]},
+    {"name": "🪨 Gotsumon", "map": "Campground", "frequency": "biweekly", "base_date": "2025-09-01", "times": ["19:00"]},
+    {"name": "🪽 Andromon", "map": "Gear Savannah", "frequency": "rotation", "base_date": "2025-09-01", "times": ["14:00"]},
+]
+
+def _times_for(timeline, name):
+    return [r["next_time"] for r in timeline if r["name"] == name]
+
+def test_projection_covers_horizon_in_order():
+    projector = ScheduleProjector(RAIDS, KST, horizon_days=14)
+    now = KST.localize(datetime(2025, 9, 10, 12, 0))
+    timeline = projector.project(now)
+
+    times = [r["next_time"] for r in timeline]
+    assert times == sorted(times)
+    # Horizon plus the previous day, twice a day
+    assert len(_times_for(timeline, "🎃 Pumpkinmon")) == 30
+    assert _times_for(timeline, "🪨 Gotsumon") == [KST.localize(datetime(2025, 9, 15, 19, 0))]
+
+def test_rotation_shifts_25_minutes_per_day():
+    projector = ScheduleProjector(RAIDS, KST, horizon_days=3)
+    now = KST.localize(datetime(2025, 9, 3, 0, 0))
+    andromon = _times_for(projector.upcoming(now), "🪽 Andromon")
+
+    assert andromon[0] == KST.localize(datetime(2025, 9, 3, 14, 50))
+    assert andromon[1] - andromon[0] == timedelta(days=1, minutes=25)
+
+def test_upcoming_skips_past_occurrences():
+    projector = ScheduleProjector(RAIDS, KST, horizon_days=1)
+    now = KST.localize(datetime(2025, 9, 10, 19, 0))
+    upcoming = projector.upcoming(now)
+
+    assert [r["name"] for r in upcoming] == ["🎃 Pumpkinmon"]
+    assert upcoming[0]["scheduled_time"] == "20:30"
+
+def test_window_includes_ongoing_raids_across_midnight():
+    raids = [{"name": "🌙 Lunamon", "map": "Moon", "frequency": "daily", "times": ["23:58"]}]
+    projector = ScheduleProjector(raids, KST, horizon_days=1)
+    now = KST.localize(datetime(2025, 9, 10, 0, 1))
+    active = projector.window(now, timedelta(minutes=15), timedelta(minutes=5))
+
+    assert [r["next_time"] for r in active] == [KST.localize(datetime(2025, 9, 9, 23, 58))]
+
+def test_cache_reused_until_day_or_schedule_changes():
+    projector = ScheduleProjector(RAIDS, KST)
+    morning = KST.localize(datetime(2025, 9, 10, 8, 0))
+    evening = KST.localize(datetime(2025, 9, 10, 22, 0))
+    first = projector.project(morning)
+
+    assert projector.project(evening) is first
+    assert projector.project(morning + timedelta(days=1)) is not first
+
+    second = projector.project(morning + timedelta(days=1))
+    projector.set_schedule(RAIDS[:1])
+    assert projector.project(morning + timedelta(days=1)) is not second
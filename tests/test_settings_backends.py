@@ -0,0 +1,79 @@
+import json
+import pytest
+from bot.utils.settings_backends import JsonSettingsBackend, MemorySettingsBackend, SqliteSettingsBackend
+from bot.utils.settings_manager import SettingsManager
+
+LEGACY = {
+    "1": {"language": "spanish", "raid_alerts": {"enabled": True, "channel_id": 10}},
+    "2": {"raid_alerts": {"enabled": False}},
+}
+
+@pytest.fixture
+def json_path(tmp_path):
+    path = tmp_path / "server_settings.json"
+    path.write_text(json.dumps(LEGACY), encoding="utf-8")
+    return str(path)
+
+@pytest.mark.parametrize("backend_factory", [
+    lambda tmp_path, json_path: MemorySettingsBackend(LEGACY),
+    lambda tmp_path, json_path: JsonSettingsBackend(json_path),
+    lambda tmp_path, json_path: SqliteSettingsBackend(str(tmp_path / "settings.db"), json_path=json_path),
+])
+def test_backends_share_behaviour(tmp_path, json_path, backend_factory):
+    backend = backend_factory(tmp_path, json_path)
+    assert backend.load_all() == LEGACY
+    assert backend.enabled_guild_ids() == ["1"]
+
+    merged = backend.update_guild("2", {"raid_alerts": {"enabled": True}, "timezone": "london"})
+    assert merged == {"raid_alerts": {"enabled": True}, "timezone": "london"}
+    assert sorted(backend.enabled_guild_ids()) == ["1", "2"]
+    assert backend.load_all()["2"]["timezone"] == "london"
+
+def test_sqlite_migrates_json_only_once(tmp_path, json_path):
+    db_path = str(tmp_path / "settings.db")
+    SqliteSettingsBackend(db_path, json_path=json_path).update_guild("1", {"language": "english"})
+
+    with open(json_path, "w", encoding="utf-8") as f:
+        json.dump({"3": {}}, f)
+    settings = SqliteSettingsBackend(db_path, json_path=json_path).load_all()
+
+    assert settings["1"]["language"] == "english"
+    assert "3" not in settings
+
+def test_sqlite_enabled_query_uses_index(tmp_path):
+    backend = SqliteSettingsBackend(str(tmp_path / "settings.db"))
+    plan = backend.conn.execute(
+        "EXPLAIN QUERY PLAN SELECT guild_id FROM guild_settings WHERE raid_alerts_enabled = 1"
+    ).fetchall()
+    assert any("idx_guild_settings_raid_alerts_enabled" in row[-1] for row in plan)
+
+def test_injected_backend_bypasses_singleton():
+    manager = SettingsManager(MemorySettingsBackend(LEGACY))
+    manager.update_guild_settings("2", {"raid_alerts": {"enabled": True}})
+
+    assert manager is not SettingsManager()
+    assert sorted(manager.get_enabled_guilds()) == ["1", "2"]
+    assert LEGACY["2"] == {"raid_alerts": {"enabled": False}}
+
+@pytest.fixture
+def sqlite_manager(tmp_path, json_path, monkeypatch):
+    # Fresh singleton on the SQLite backend with both files under tmp_path
+    monkeypatch.setenv("SETTINGS_BACKEND", "sqlite")
+    monkeypatch.delenv("SETTINGS_DB", raising=False)
+    monkeypatch.setattr(SettingsManager, "SETTINGS_FILE", json_path)
+    monkeypatch.setattr(SettingsManager, "SETTINGS_DB", str(tmp_path / "settings.db"))
+    monkeypatch.setattr(SettingsManager, "_instance", None)
+    return SettingsManager()
+
+def test_sqlite_manager_cache_and_database_agree(sqlite_manager):
+    assert isinstance(sqlite_manager.backend, SqliteSettingsBackend)
+    assert sqlite_manager.settings == LEGACY
+
+    sqlite_manager.update_guild_settings("2", {"raid_alerts": {"enabled": True, "lead_minutes": 30}})
+    sqlite_manager.update_guild_settings("1", {"raid_alerts": {"enabled": False}})
+    cached = {guild_id: dict(settings) for guild_id, settings in sqlite_manager.settings.items()}
+
+    assert sqlite_manager.get_enabled_guilds() == ["2"]
+    sqlite_manager.load_settings()
+    assert sqlite_manager.settings == cached
+    assert sqlite_manager.get_guild_settings("2")["raid_alerts"]["lead_minutes"] == 30
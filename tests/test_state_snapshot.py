@@ -0,0 +1,111 @@
+import asyncio
+import os
+import shutil
+import threading
+import pytest
+import pytz
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+from bot.cogs.raid_alert import RaidAlert
+from bot.utils import state_snapshot
+from bot.utils.clock import SimulatedClock
+from bot.utils.schedule_projection import ScheduleProjector
+
+KST = pytz.timezone("Asia/Seoul")
+
+@pytest.fixture
+def sources(tmp_path, monkeypatch):
+    schedule = tmp_path / "raid_schedule.yaml"
+    schedule.write_text("raids: []\n", encoding="utf-8")
+    locales = tmp_path / "locales"
+    locales.mkdir()
+    (locales / "en.json").write_text("{}", encoding="utf-8")
+    monkeypatch.setattr(state_snapshot, "SCHEDULE_PATH", str(schedule))
+    monkeypatch.setattr(state_snapshot, "LOCALES_DIR", str(locales))
+    monkeypatch.setattr(state_snapshot, "SNAPSHOT_PATH", str(tmp_path / ".cache" / "state_snapshot.pickle"))
+    return schedule, locales
+
+@pytest.fixture
+def repo_sources(tmp_path, monkeypatch):
+    # Copies of the real schedule and locales, with the snapshot written under tmp_path
+    schedule = tmp_path / "raid_schedule.yaml"
+    shutil.copy(state_snapshot.SCHEDULE_PATH, schedule)
+    shutil.copytree(state_snapshot.LOCALES_DIR, tmp_path / "locales")
+    monkeypatch.setattr(state_snapshot, "SCHEDULE_PATH", str(schedule))
+    monkeypatch.setattr(state_snapshot, "LOCALES_DIR", str(tmp_path / "locales"))
+    monkeypatch.setattr(state_snapshot, "SNAPSHOT_PATH", str(tmp_path / ".cache" / "state_snapshot.pickle"))
+    return tmp_path
+
+def test_snapshot_round_trip(sources):
+    signature = state_snapshot.source_signature()
+    state_snapshot.save_snapshot(signature, {"raids": [{"name": "🎲 Omnimon"}]})
+
+    snapshot = state_snapshot.load_snapshot(signature)
+    assert snapshot["raids"] == [{"name": "🎲 Omnimon"}]
+
+def test_snapshot_invalidated_when_sources_change(sources):
+    schedule, locales = sources
+    signature = state_snapshot.source_signature()
+    state_snapshot.save_snapshot(signature, {"raids": []})
+
+    stat = os.stat(schedule)
+    os.utime(schedule, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert state_snapshot.load_snapshot(state_snapshot.source_signature()) is None
+
+    (locales / "pt.json").write_text("{}", encoding="utf-8")
+    assert state_snapshot.source_signature() != signature
+
+def test_cog_load_compiles_state_off_the_event_loop(settings_store, alert_state):
+    cog = RaidAlert(MagicMock(), settings=settings_store, snapshot=False, alert_state=alert_state)
+    threads = []
+    load_state = cog._load_state
+
+    def record_thread():
+        threads.append(threading.get_ident())
+        load_state()
+
+    async def run_cog_load():
+        with patch.object(cog, "_load_state", side_effect=record_thread), \
+             patch.object(RaidAlert, "_raid_alert_loop"), patch.object(RaidAlert, "_message_retention_loop"):
+            await cog.cog_load()
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(run_cog_load())
+    assert threads and threads[0] != loop_thread
+    assert cog.raids
+
+def test_cog_restores_state_from_warm_snapshot(repo_sources, make_cog):
+    cold = make_cog(snapshot=True)
+    assert os.path.exists(state_snapshot.SNAPSHOT_PATH)
+
+    with patch.object(RaidAlert, "_load_raid_schedule", side_effect=AssertionError("parsed YAML")), \
+         patch.object(RaidAlert, "_load_locales", side_effect=AssertionError("parsed locales")):
+        warm = make_cog(snapshot=True)
+
+    assert warm.raids == cold.raids
+    assert warm.locales == cold.locales
+    assert warm.schedule_projector.export_cache()[0] == cold.schedule_projector.export_cache()[0]
+
+def test_snapshot_disabled_never_writes(repo_sources, make_cog):
+    make_cog(snapshot=False)
+    assert not os.path.exists(state_snapshot.SNAPSHOT_PATH)
+
+def test_restore_cache_rejects_other_schedule():
+    projector = ScheduleProjector([{"name": "🎲 Omnimon", "map": "?", "times": ["20:00"]}], KST)
+    other = ScheduleProjector([{"name": "🎃 Pumpkinmon", "map": "?", "times": ["18:30"]}], KST)
+    other.project(KST.localize(datetime(2025, 9, 10)))
+
+    projector.restore_cache(*other.export_cache())
+    assert projector.export_cache() == (None, [])
+
+def test_snapshot_timeline_rebuilt_when_day_changes(repo_sources, settings_store):
+    day_one = KST.localize(datetime(2025, 9, 10, 12, 0))
+    RaidAlert(MagicMock(), clock=SimulatedClock(day_one), settings=settings_store)._load_state()
+
+    cog = RaidAlert(MagicMock(), clock=SimulatedClock(day_one + timedelta(days=1)), settings=settings_store)
+    cog._load_state()
+
+    expected_date = (day_one + timedelta(days=1)).date()
+    assert cog.schedule_projector.export_cache()[0][1] == expected_date
+    snapshot = state_snapshot.load_snapshot(state_snapshot.source_signature())
+    assert snapshot["timeline"][0][1] == expected_date